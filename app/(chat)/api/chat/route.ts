@@ -12,8 +12,9 @@ import {
   deleteChatById,
   getChatById,
   getMessageCountByUserId,
+  getLatestMessageByChatId,
+  getLatestStreamIdByChatId,
   getMessagesByChatId,
-  getStreamIdsByChatId,
   saveChat,
   saveMessages,
 } from '@/lib/db/queries';
@@ -83,17 +84,18 @@ export async function POST(request: Request) {
 
     const userType: UserType = session.user.type;
 
-    const messageCount = await getMessageCountByUserId({
-      id: session.user.id,
-      differenceInHours: 24,
-    });
+    const [messageCount, chat] = await Promise.all([
+      getMessageCountByUserId({
+        id: session.user.id,
+        differenceInHours: 24,
+      }),
+      getChatById({ id }),
+    ]);
 
     if (messageCount > entitlementsByUserType[userType].maxMessagesPerDay) {
       return new ChatSDKError('rate_limit:chat').toResponse();
     }
 
-    const chat = await getChatById({ id });
-
     if (!chat) {
       const title = await generateTitleFromUserMessage({
         message,
@@ -111,7 +113,7 @@ export async function POST(request: Request) {
       }
     }
 
-    const previousMessages = await getMessagesByChatId({ id });
+    const previousMessages = chat ? await getMessagesByChatId({ id }) : [];
 
     const messages = appendClientMessage({
       // @ts-expect-error: todo add type conversion from DBMessage[] to UIMessage[]
@@ -128,21 +130,23 @@ export async function POST(request: Request) {
       country,
     };
 
-    await saveMessages({
-      messages: [
-        {
-          chatId: id,
-          id: message.id,
-          role: 'user',
-          parts: message.parts,
-          attachments: message.experimental_attachments ?? [],
-          createdAt: new Date(),
-        },
-      ],
-    });
-
     const streamId = generateUUID();
-    await createStreamId({ streamId, chatId: id });
+
+    await Promise.all([
+      saveMessages({
+        messages: [
+          {
+            chatId: id,
+            id: message.id,
+            role: 'user',
+            parts: message.parts,
+            attachments: message.experimental_attachments ?? [],
+            createdAt: new Date(),
+          },
+        ],
+      }),
+      createStreamId({ streamId, chatId: id }),
+    ]);
 
     const stream = createDataStream({
       execute: (dataStream) => {
@@ -277,13 +281,7 @@ export async function GET(request: Request) {
     return new ChatSDKError('forbidden:chat').toResponse();
   }
 
-  const streamIds = await getStreamIdsByChatId({ chatId });
-
-  if (!streamIds.length) {
-    return new ChatSDKError('not_found:stream').toResponse();
-  }
-
-  const recentStreamId = streamIds.at(-1);
+  const recentStreamId = await getLatestStreamIdByChatId({ chatId });
 
   if (!recentStreamId) {
     return new ChatSDKError('not_found:stream').toResponse();
@@ -303,8 +301,7 @@ export async function GET(request: Request) {
    * but the resumable stream has concluded at this point.
    */
   if (!stream) {
-    const messages = await getMessagesByChatId({ id: chatId });
-    const mostRecentMessage = messages.at(-1);
+    const mostRecentMessage = await getLatestMessageByChatId({ id: chatId });
 
     if (!mostRecentMessage) {
       return new Response(emptyDataStream, { status: 200 });
@@ -314,9 +311,9 @@ export async function GET(request: Request) {
       return new Response(emptyDataStream, { status: 200 });
     }
 
-    const messageCreatedAt = new Date(mostRecentMessage.createdAt);
-
-    if (differenceInSeconds(resumeRequestedAt, messageCreatedAt) > 15) {
+    if (
+      differenceInSeconds(resumeRequestedAt, mostRecentMessage.createdAt) > 15
+    ) {
       return new Response(emptyDataStream, { status: 200 });
     }
 
@@ -351,6 +348,10 @@ export async function DELETE(request: Request) {
 
   const chat = await getChatById({ id });
 
+  if (!chat) {
+    return new ChatSDKError('not_found:chat').toResponse();
+  }
+
   if (chat.userId !== session.user.id) {
     return new ChatSDKError('forbidden:chat').toResponse();
   }
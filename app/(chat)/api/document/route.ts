@@ -2,6 +2,7 @@ import { auth } from '@/app/(auth)/auth';
 import type { ArtifactKind } from '@/components/artifact';
 import {
   deleteDocumentsByIdAfterTimestamp,
+  getDocumentById,
   getDocumentsById,
   saveDocument,
 } from '@/lib/db/queries';
@@ -63,14 +64,10 @@ export async function POST(request: Request) {
   }: { content: string; title: string; kind: ArtifactKind } =
     await request.json();
 
-  const documents = await getDocumentsById({ id });
-
-  if (documents.length > 0) {
-    const [document] = documents;
+  const existingDocument = await getDocumentById({ id });
 
-    if (document.userId !== session.user.id) {
-      return new ChatSDKError('forbidden:document').toResponse();
-    }
+  if (existingDocument && existingDocument.userId !== session.user.id) {
+    return new ChatSDKError('forbidden:document').toResponse();
   }
 
   const document = await saveDocument({
@@ -109,9 +106,11 @@ export async function DELETE(request: Request) {
     return new ChatSDKError('unauthorized:document').toResponse();
   }
 
-  const documents = await getDocumentsById({ id });
+  const document = await getDocumentById({ id });
 
-  const [document] = documents;
+  if (!document) {
+    return new ChatSDKError('not_found:document').toResponse();
+  }
 
   if (document.userId !== session.user.id) {
     return new ChatSDKError('forbidden:document').toResponse();
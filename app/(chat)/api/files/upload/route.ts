@@ -4,11 +4,16 @@ import { z } from 'zod';
 
 import { auth } from '@/app/(auth)/auth';
 
+const MAX_FILE_SIZE = 5 * 1024 * 1024;
+
+// Allowance for the multipart boundaries and part headers around the file
+const MAX_REQUEST_SIZE = MAX_FILE_SIZE + 16 * 1024;
+
 // Use Blob instead of File since File is not available in Node.js environment
 const FileSchema = z.object({
   file: z
     .instanceof(Blob)
-    .refine((file) => file.size <= 5 * 1024 * 1024, {
+    .refine((file) => file.size <= MAX_FILE_SIZE, {
       message: 'File size should be less than 5MB',
     })
     // Update the file type based on the kind of files you want to accept
@@ -28,6 +33,13 @@ export async function POST(request: Request) {
     return new Response('Request body is empty', { status: 400 });
   }
 
+  if (Number(request.headers.get('content-length')) > MAX_REQUEST_SIZE) {
+    return NextResponse.json(
+      { error: 'File size should be less than 5MB' },
+      { status: 400 },
+    );
+  }
+
   try {
     const formData = await request.formData();
     const file = formData.get('file') as Blob;
@@ -48,10 +60,9 @@ export async function POST(request: Request) {
 
     // Get filename from formData since Blob doesn't have name property
     const filename = (formData.get('file') as File).name;
-    const fileBuffer = await file.arrayBuffer();
 
     try {
-      const data = await put(`${filename}`, fileBuffer, {
+      const data = await put(`${filename}`, file, {
         access: 'public',
       });
 
@@ -1,3 +1,4 @@
+import { createHash } from 'node:crypto';
 import { auth } from '@/app/(auth)/auth';
 import type { NextRequest } from 'next/server';
 import { getChatsByUserId } from '@/lib/db/queries';
@@ -30,5 +31,30 @@ export async function GET(request: NextRequest) {
     endingBefore,
   });
 
-  return Response.json(chats);
+  const body = JSON.stringify(chats);
+  const opaqueTag = `"${createHash('sha1').update(body).digest('base64url')}"`;
+
+  const headers = {
+    'Cache-Control': 'private, no-cache',
+    ETag: `W/${opaqueTag}`,
+  };
+
+  if (matchesIfNoneMatch(request.headers.get('if-none-match'), opaqueTag)) {
+    return new Response(null, { status: 304, headers });
+  }
+
+  return new Response(body, {
+    status: 200,
+    headers: { ...headers, 'Content-Type': 'application/json' },
+  });
+}
+
+// If-None-Match uses weak comparison and may list several tags or `*`
+function matchesIfNoneMatch(header: string | null, opaqueTag: string) {
+  if (!header) return false;
+
+  return header.split(',').some((candidate) => {
+    const tag = candidate.trim();
+    return tag === '*' || tag.replace(/^W\//, '') === opaqueTag;
+  });
 }
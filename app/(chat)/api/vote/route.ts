@@ -19,7 +19,10 @@ export async function GET(request: Request) {
     return new ChatSDKError('unauthorized:vote').toResponse();
   }
 
-  const chat = await getChatById({ id: chatId });
+  const [chat, votes] = await Promise.all([
+    getChatById({ id: chatId }),
+    getVotesByChatId({ id: chatId }),
+  ]);
 
   if (!chat) {
     return new ChatSDKError('not_found:chat').toResponse();
@@ -29,8 +32,6 @@ export async function GET(request: Request) {
     return new ChatSDKError('forbidden:vote').toResponse();
   }
 
-  const votes = await getVotesByChatId({ id: chatId });
-
   return Response.json(votes, { status: 200 });
 }
 
@@ -68,12 +68,13 @@ export const requestSuggestions = ({
 
       if (session.user?.id) {
         const userId = session.user.id;
+        const createdAt = new Date();
 
         await saveSuggestions({
           suggestions: suggestions.map((suggestion) => ({
             ...suggestion,
             userId,
-            createdAt: new Date(),
+            createdAt,
             documentCreatedAt: document.createdAt,
           })),
         });
@@ -0,0 +1,2 @@
+CREATE INDEX IF NOT EXISTS "Chat_userId_createdAt_index" ON "Chat" USING btree ("userId","createdAt");--> statement-breakpoint
+CREATE INDEX IF NOT EXISTS "Message_v2_chatId_createdAt_index" ON "Message_v2" USING btree ("chatId","createdAt");
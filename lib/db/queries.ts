@@ -33,13 +33,27 @@ import { generateUUID } from '../utils';
 import { generateHashedPassword } from './utils';
 import type { VisibilityType } from '@/components/visibility-selector';
 import { ChatSDKError } from '../errors';
+import { isProductionEnvironment } from '../constants';
 
 // Optionally, if not using email/pass login, you can
 // use the Drizzle adapter for Auth.js / NextAuth
 // https://authjs.dev/reference/adapter/drizzle
 
-// biome-ignore lint: Forbidden non-null assertion.
-const client = postgres(process.env.POSTGRES_URL!);
+// Reuse one connection pool per process. In development, hot reloads
+// re-evaluate this module and would otherwise open a new pool each time.
+const globalForDb = globalThis as unknown as {
+  postgresClient: postgres.Sql | undefined;
+};
+
+const client =
+  globalForDb.postgresClient ??
+  // biome-ignore lint: Forbidden non-null assertion.
+  postgres(process.env.POSTGRES_URL!);
+
+if (!isProductionEnvironment) {
+  globalForDb.postgresClient = client;
+}
+
 const db = drizzle(client);
 
 export async function getUser(email: string): Promise<Array<User>> {
@@ -54,7 +68,7 @@ export async function getUser(email: string): Promise<Array<User>> {
 }
 
 export async function createUser(email: string, password: string) {
-  const hashedPassword = generateHashedPassword(password);
+  const hashedPassword = await generateHashedPassword(password);
 
   try {
     return await db.insert(user).values({ email, password: hashedPassword });
@@ -65,7 +79,7 @@ export async function createUser(email: string, password: string) {
 
 export async function createGuestUser() {
   const email = `guest-${Date.now()}`;
-  const password = generateHashedPassword(generateUUID());
+  const password = await generateHashedPassword(generateUUID());
 
   try {
     return await db.insert(user).values({ email, password }).returning({
@@ -106,15 +120,17 @@ export async function saveChat({
 
 export async function deleteChatById({ id }: { id: string }) {
   try {
-    await db.delete(vote).where(eq(vote.chatId, id));
-    await db.delete(message).where(eq(message.chatId, id));
-    await db.delete(stream).where(eq(stream.chatId, id));
-
-    const [chatsDeleted] = await db
-      .delete(chat)
-      .where(eq(chat.id, id))
-      .returning();
-    return chatsDeleted;
+    return await db.transaction(async (tx) => {
+      await tx.delete(vote).where(eq(vote.chatId, id));
+      await tx.delete(message).where(eq(message.chatId, id));
+      await tx.delete(stream).where(eq(stream.chatId, id));
+
+      const [chatsDeleted] = await tx
+        .delete(chat)
+        .where(eq(chat.id, id))
+        .returning();
+      return chatsDeleted;
+    });
   } catch (error) {
     throw new ChatSDKError(
       'bad_request:database',
@@ -153,7 +169,7 @@ export async function getChatsByUserId({
 
     if (startingAfter) {
       const [selectedChat] = await db
-        .select()
+        .select({ createdAt: chat.createdAt })
         .from(chat)
         .where(eq(chat.id, startingAfter))
         .limit(1);
@@ -168,7 +184,7 @@ export async function getChatsByUserId({
       filteredChats = await query(gt(chat.createdAt, selectedChat.createdAt));
     } else if (endingBefore) {
       const [selectedChat] = await db
-        .select()
+        .select({ createdAt: chat.createdAt })
         .from(chat)
         .where(eq(chat.id, endingBefore))
         .limit(1);
@@ -235,6 +251,24 @@ export async function getMessagesByChatId({ id }: { id: string }) {
   }
 }
 
+export async function getLatestMessageByChatId({ id }: { id: string }) {
+  try {
+    const [latestMessage] = await db
+      .select()
+      .from(message)
+      .where(eq(message.chatId, id))
+      .orderBy(desc(message.createdAt))
+      .limit(1);
+
+    return latestMessage;
+  } catch (error) {
+    throw new ChatSDKError(
+      'bad_request:database',
+      'Failed to get latest message by chat id',
+    );
+  }
+}
+
 export async function voteMessage({
   chatId,
   messageId,
@@ -245,22 +279,17 @@ export async function voteMessage({
   type: 'up' | 'down';
 }) {
   try {
-    const [existingVote] = await db
-      .select()
-      .from(vote)
-      .where(and(eq(vote.messageId, messageId)));
-
-    if (existingVote) {
-      return await db
-        .update(vote)
-        .set({ isUpvoted: type === 'up' })
-        .where(and(eq(vote.messageId, messageId), eq(vote.chatId, chatId)));
-    }
-    return await db.insert(vote).values({
-      chatId,
-      messageId,
-      isUpvoted: type === 'up',
-    });
+    return await db
+      .insert(vote)
+      .values({
+        chatId,
+        messageId,
+        isUpvoted: type === 'up',
+      })
+      .onConflictDoUpdate({
+        target: [vote.chatId, vote.messageId],
+        set: { isUpvoted: type === 'up' },
+      });
   } catch (error) {
     throw new ChatSDKError('bad_request:database', 'Failed to vote message');
   }
@@ -330,7 +359,8 @@ export async function getDocumentById({ id }: { id: string }) {
       .select()
       .from(document)
       .where(eq(document.id, id))
-      .orderBy(desc(document.createdAt));
+      .orderBy(desc(document.createdAt))
+      .limit(1);
 
     return selectedDocument;
   } catch (error) {
@@ -349,19 +379,21 @@ export async function deleteDocumentsByIdAfterTimestamp({
   timestamp: Date;
 }) {
   try {
-    await db
-      .delete(suggestion)
-      .where(
-        and(
-          eq(suggestion.documentId, id),
-          gt(suggestion.documentCreatedAt, timestamp),
-        ),
-      );
+    return await db.transaction(async (tx) => {
+      await tx
+        .delete(suggestion)
+        .where(
+          and(
+            eq(suggestion.documentId, id),
+            gt(suggestion.documentCreatedAt, timestamp),
+          ),
+        );
 
-    return await db
-      .delete(document)
-      .where(and(eq(document.id, id), gt(document.createdAt, timestamp)))
-      .returning();
+      return await tx
+        .delete(document)
+        .where(and(eq(document.id, id), gt(document.createdAt, timestamp)))
+        .returning();
+    });
   } catch (error) {
     throw new ChatSDKError(
       'bad_request:database',
@@ -422,28 +454,29 @@ export async function deleteMessagesByChatIdAfterTimestamp({
   timestamp: Date;
 }) {
   try {
-    const messagesToDelete = await db
-      .select({ id: message.id })
-      .from(message)
-      .where(
-        and(eq(message.chatId, chatId), gte(message.createdAt, timestamp)),
-      );
-
-    const messageIds = messagesToDelete.map((message) => message.id);
+    return await db.transaction(async (tx) => {
+      const messagesToDelete = tx
+        .select({ id: message.id })
+        .from(message)
+        .where(
+          and(eq(message.chatId, chatId), gte(message.createdAt, timestamp)),
+        );
 
-    if (messageIds.length > 0) {
-      await db
+      await tx
         .delete(vote)
         .where(
-          and(eq(vote.chatId, chatId), inArray(vote.messageId, messageIds)),
+          and(
+            eq(vote.chatId, chatId),
+            inArray(vote.messageId, messagesToDelete),
+          ),
         );
 
-      return await db
+      return await tx
         .delete(message)
         .where(
-          and(eq(message.chatId, chatId), inArray(message.id, messageIds)),
+          and(eq(message.chatId, chatId), gte(message.createdAt, timestamp)),
         );
-    }
+    });
   } catch (error) {
     throw new ChatSDKError(
       'bad_request:database',
@@ -519,20 +552,24 @@ export async function createStreamId({
   }
 }
 
-export async function getStreamIdsByChatId({ chatId }: { chatId: string }) {
+export async function getLatestStreamIdByChatId({
+  chatId,
+}: {
+  chatId: string;
+}) {
   try {
-    const streamIds = await db
+    const [latestStream] = await db
       .select({ id: stream.id })
       .from(stream)
       .where(eq(stream.chatId, chatId))
-      .orderBy(asc(stream.createdAt))
-      .execute();
+      .orderBy(desc(stream.createdAt))
+      .limit(1);
 
-    return streamIds.map(({ id }) => id);
+    return latestStream?.id ?? null;
   } catch (error) {
     throw new ChatSDKError(
       'bad_request:database',
-      'Failed to get stream ids by chat id',
+      'Failed to get latest stream id by chat id',
     );
   }
 }
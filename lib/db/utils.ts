@@ -1,16 +1,17 @@
 import { generateId } from 'ai';
-import { genSaltSync, hashSync } from 'bcrypt-ts';
+import { genSalt, genSaltSync, hash, hashSync } from 'bcrypt-ts';
 
-export function generateHashedPassword(password: string) {
-  const salt = genSaltSync(10);
-  const hash = hashSync(password, salt);
+export async function generateHashedPassword(password: string) {
+  const salt = await genSalt(10);
+  const hashedPassword = await hash(password, salt);
 
-  return hash;
+  return hashedPassword;
 }
 
 export function generateDummyPassword() {
   const password = generateId(12);
-  const hashedPassword = generateHashedPassword(password);
+  const salt = genSaltSync(10);
+  const hashedPassword = hashSync(password, salt);
 
   return hashedPassword;
 }
@@ -75,6 +75,19 @@ test.describe
       expect(message).toEqual(getMessageByErrorCode('forbidden:chat'));
     });
 
+    test('Ada cannot delete a chat that does not exist', async ({
+      adaContext,
+    }) => {
+      const response = await adaContext.request.delete(
+        `/api/chat?id=${generateUUID()}`,
+      );
+      expect(response.status()).toBe(404);
+
+      const { code, message } = await response.json();
+      expect(code).toEqual('not_found:chat');
+      expect(message).toEqual(getMessageByErrorCode(code));
+    });
+
     test('Ada can delete her own chat', async ({ adaContext }) => {
       const [chatId] = chatIdsCreatedByAda;
 
@@ -0,0 +1,118 @@
+import { generateUUID } from '@/lib/utils';
+import { expect, test } from '../fixtures';
+
+const etagsSeenByAda: Array<string> = [];
+const chatIdsCreatedByAda: Array<string> = [];
+
+test.describe
+  .serial('/api/history', () => {
+    test('Ada can retrieve her chat history with an ETag', async ({
+      adaContext,
+    }) => {
+      const response = await adaContext.request.get('/api/history?limit=10');
+      expect(response.status()).toBe(200);
+
+      const headers = response.headers();
+      expect(headers.etag).toMatch(/^W\/".+"$/);
+      expect(headers['cache-control']).toEqual('private, no-cache');
+
+      const { chats, hasMore } = await response.json();
+      expect(Array.isArray(chats)).toBe(true);
+      expect(typeof hasMore).toBe('boolean');
+
+      etagsSeenByAda.push(headers.etag);
+    });
+
+    test('Ada receives 304 when her chat history has not changed', async ({
+      adaContext,
+    }) => {
+      const [etag] = etagsSeenByAda;
+
+      const response = await adaContext.request.get('/api/history?limit=10', {
+        headers: { 'If-None-Match': etag },
+      });
+      expect(response.status()).toBe(304);
+
+      const headers = response.headers();
+      expect(headers.etag).toEqual(etag);
+      expect(headers['cache-control']).toEqual('private, no-cache');
+    });
+
+    test('Ada receives 304 when revalidating with a strong or listed tag', async ({
+      adaContext,
+    }) => {
+      const [etag] = etagsSeenByAda;
+      const strongTag = etag.replace(/^W\//, '');
+
+      const response = await adaContext.request.get('/api/history?limit=10', {
+        headers: { 'If-None-Match': `"stale", ${strongTag}` },
+      });
+      expect(response.status()).toBe(304);
+    });
+
+    test('Ada receives a new ETag after creating a chat', async ({
+      adaContext,
+    }) => {
+      const chatId = generateUUID();
+
+      const chatResponse = await adaContext.request.post('/api/chat', {
+        data: {
+          id: chatId,
+          message: {
+            id: generateUUID(),
+            role: 'user',
+            content: 'Why is the sky blue?',
+            parts: [{ type: 'text', text: 'Why is the sky blue?' }],
+            createdAt: new Date().toISOString(),
+          },
+          selectedChatModel: 'chat-model',
+          selectedVisibilityType: 'private',
+        },
+      });
+      expect(chatResponse.status()).toBe(200);
+      await chatResponse.text();
+
+      chatIdsCreatedByAda.push(chatId);
+
+      const [etag] = etagsSeenByAda;
+
+      const response = await adaContext.request.get('/api/history?limit=10', {
+        headers: { 'If-None-Match': etag },
+      });
+      expect(response.status()).toBe(200);
+
+      const newEtag = response.headers().etag;
+      expect(newEtag).not.toEqual(etag);
+
+      const { chats } = await response.json();
+      expect(chats).toEqual(
+        expect.arrayContaining([expect.objectContaining({ id: chatId })]),
+      );
+
+      etagsSeenByAda.push(newEtag);
+    });
+
+    test('Ada receives a new ETag after deleting a chat', async ({
+      adaContext,
+    }) => {
+      const [chatId] = chatIdsCreatedByAda;
+
+      const deleteResponse = await adaContext.request.delete(
+        `/api/chat?id=${chatId}`,
+      );
+      expect(deleteResponse.status()).toBe(200);
+
+      const etag = etagsSeenByAda.at(-1) as string;
+
+      const response = await adaContext.request.get('/api/history?limit=10', {
+        headers: { 'If-None-Match': etag },
+      });
+      expect(response.status()).toBe(200);
+      expect(response.headers().etag).not.toEqual(etag);
+
+      const { chats } = await response.json();
+      expect(chats).not.toEqual(
+        expect.arrayContaining([expect.objectContaining({ id: chatId })]),
+      );
+    });
+  });